@@ -1,9 +1,15 @@
-from src.api import HeadHunterAPI
-from src.functions import get_filters, print_top_vacancies, filter_vacancies, continue_with_saved_file
-from src.vacancy_manager import VacancyManagerJSON
+import sys
+import time
+
+START_TIME = time.perf_counter()  # Момент запуска для отчёта --startup-time
 
 
 def user_interaction():
+    # Импорты внутри функции, чтобы неинтерактивный режим и --help не загружали requests
+    from src.api import HeadHunterAPI
+    from src.functions import get_filters, print_top_vacancies, filter_vacancies, continue_with_saved_file
+    from src.vacancy_manager import VacancyManagerJSON
+
     hh_api = HeadHunterAPI()
 
     # Запрос ключевого слова у пользователя для поиска вакансий
@@ -50,4 +56,8 @@ def user_interaction():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from src.cli import main
+
+        sys.exit(main(sys.argv[1:], START_TIME))
     user_interaction()
@@ -0,0 +1,303 @@
+"""
+Неинтерактивный режим работы с вакансиями для запуска из cron и скриптов.
+
+Модули с HTTP-клиентом и обработкой вакансий импортируются лениво, только когда они
+нужны выбранной команде, поэтому `--help` и команды для работы с сохранёнными файлами
+не загружают requests.
+
+Коды завершения: 0 - успешно (в том числе если вакансии не найдены), 1 - ошибка запроса
+к hh.ru, отсутствующий файл или pyarrow, 2 - неверные аргументы, 3 - команда выполнена,
+но время запуска превысило --startup-budget.
+"""
+import argparse
+from datetime import datetime
+import importlib
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+EXIT_ERROR = 1
+EXIT_OVER_BUDGET = 3
+
+
+class StartupTimer:
+    """
+    Замеряет время запуска программы и время ленивых импортов.
+
+    Атрибуты:
+    - start_time (float): Момент запуска по time.perf_counter.
+    - imports (List): Список пар (модуль, время импорта в секундах).
+    - over_budget (bool): Превысило ли время запуска бюджет при последнем вызове report.
+    """
+
+    def __init__(self, start_time: Optional[float] = None):
+        """
+        Инициализирует таймер.
+
+        :param start_time: Момент запуска программы. По умолчанию - момент создания таймера.
+        """
+        self.start_time = time.perf_counter() if start_time is None else start_time
+        self.imports = []
+        self.over_budget = False
+
+    def import_module(self, name: str):
+        """
+        Импортирует модуль и запоминает, сколько времени занял импорт.
+
+        :param name: Полное имя модуля.
+        :return: Импортированный модуль.
+        """
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        self.imports.append((name, time.perf_counter() - started))
+        return module
+
+    def elapsed_ms(self) -> float:
+        """Возвращает время с момента запуска в миллисекундах."""
+        return (time.perf_counter() - self.start_time) * 1000
+
+    def report(self, budget_ms: Optional[float] = None) -> None:
+        """
+        Печатает в stderr время ленивых импортов в стиле `-X importtime` и общее время запуска.
+
+        :param budget_ms: Допустимое время запуска в миллисекундах. При превышении печатается
+                          предупреждение и устанавливается over_budget.
+        """
+        elapsed = self.elapsed_ms()
+        print("import time: cumulative [us] | imported module", file=sys.stderr)
+        for name, seconds in self.imports:
+            print(f"import time: {int(seconds * 1_000_000):>16} | {name}", file=sys.stderr)
+        print(f"Время запуска: {elapsed:.1f} мс", file=sys.stderr)
+        self.over_budget = budget_ms is not None and elapsed > budget_ms
+        if self.over_budget:
+            print(f"Время запуска превышает бюджет {budget_ms:g} мс.", file=sys.stderr)
+
+
+def _date_arg(value: str) -> str:
+    """Проверяет, что дата передана в формате DD.MM.YYYY."""
+    try:
+        datetime.strptime(value, "%d.%m.%Y")
+    except ValueError:
+        raise argparse.ArgumentTypeError("дата должна быть в формате ДД.ММ.ГГГГ")
+    return value
+
+
+def _add_filter_arguments(parser: argparse.ArgumentParser, saved: bool) -> None:
+    """
+    Добавляет в парсер аргументы фильтров get_filters и количество вакансий для вывода.
+
+    Поиск фильтрует вакансии через filter_vacancies, а сохранённые файлы - через
+    filter_vacancies_from_file, и «зарплата до» и «дата публикации» в них сравниваются
+    по-разному, поэтому справка описывает сравнение для каждой команды.
+
+    :param parser: Парсер подкоманды.
+    :param saved: True для команды, которая фильтрует сохранённый файл.
+    """
+    parser.add_argument("--salary-from", type=int, help="минимальная зарплата не меньше указанной")
+    if saved:
+        parser.add_argument("--salary-to", type=int, help="максимальная зарплата не меньше указанной")
+        parser.add_argument("--date", type=_date_arg,
+                            help="вакансии, опубликованные с указанной даты по сегодня (DD.MM.YYYY)")
+    else:
+        parser.add_argument("--salary-to", type=int, help="максимальная зарплата не больше указанной")
+        parser.add_argument("--date", type=_date_arg, help="вакансии, опубликованные в указанный день (DD.MM.YYYY)")
+    parser.add_argument("--city", help="город без учёта регистра")
+    parser.add_argument("--experience", help="опыт работы без учёта регистра")
+    parser.add_argument("--top", type=int, default=10, help="количество вакансий для отображения (по умолчанию 10)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Создаёт парсер аргументов командной строки."""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Поиск и анализ вакансий с сайта hh.ru без интерактивного ввода. "
+                    "Без аргументов main.py запускается в интерактивном режиме.",
+    )
+    parser.add_argument("--startup-time", action="store_true",
+                        help="вывести в stderr время запуска и ленивых импортов")
+    parser.add_argument("--startup-budget", type=float, metavar="MS",
+                        help="допустимое время запуска в миллисекундах (включает --startup-time); "
+                             "при превышении программа завершается с кодом 3")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = subparsers.add_parser("search", help="найти вакансии на hh.ru")
+    search_parser.add_argument("keyword", help="ключевое слово для поиска вакансий")
+    _add_filter_arguments(search_parser, saved=False)
+    search_parser.add_argument("-o", "--output",
+                               help="файл для сохранения отфильтрованных вакансий (.json, .parquet или .csv); "
+                                    "вакансии, которые уже есть в файле, пропускаются")
+    search_parser.add_argument("--overwrite", action="store_true",
+                               help="заменить содержимое файла --output вместо добавления новых вакансий")
+
+    show_parser = subparsers.add_parser("show", help="вывести вакансии из сохранённого файла")
+    show_parser.add_argument("path", help="файл с вакансиями (.json, .parquet или .csv)")
+    _add_filter_arguments(show_parser, saved=True)
+
+    return parser
+
+
+def filters_from_args(args: argparse.Namespace) -> Dict[str, str]:
+    """
+    Собирает фильтры из аргументов в том же формате, что возвращает get_filters.
+
+    :param args: Разобранные аргументы командной строки.
+    :return: Словарь фильтров.
+    """
+    values = {
+        "зарплата от": args.salary_from,
+        "зарплата до": args.salary_to,
+        "город": args.city,
+        "дата публикации": args.date,
+        "опыт работы": args.experience,
+    }
+    return {name: str(value) for name, value in values.items() if value is not None}
+
+
+def import_storage(path: str, timer: StartupTimer):
+    """
+    Лениво импортирует модули, нужные для работы с файлом вакансий, замеряя время импорта.
+
+    :param path: Путь к файлу с вакансиями.
+    :param timer: Таймер для замера импортов.
+    :return: Модуль src.vacancy_manager.
+    :raises ImportError: Если для файла .parquet не установлен pyarrow.
+    """
+    vacancy_manager = timer.import_module("src.vacancy_manager")
+    if path.endswith(".parquet"):
+        try:
+            timer.import_module("pyarrow.parquet")
+        except ImportError:
+            raise ImportError(f"Для работы с файлом '{path}' требуется pyarrow: poetry install -E parquet")
+    return vacancy_manager
+
+
+def open_storage(path: str, vacancy_manager):
+    """
+    Создаёт менеджер вакансий, подходящий расширению файла.
+
+    :param path: Путь к файлу с вакансиями.
+    :param vacancy_manager: Модуль src.vacancy_manager.
+    :return: VacancyManagerColumnar для .parquet и .csv, иначе VacancyManagerJSON.
+    """
+    if path.endswith((".parquet", ".csv")):
+        return vacancy_manager.VacancyManagerColumnar(path)
+    return vacancy_manager.VacancyManagerJSON(path)
+
+
+def saved_vacancy_ids(storage, vacancy_manager) -> set:
+    """
+    Возвращает идентификаторы вакансий, уже сохранённых в файле.
+
+    :param storage: Менеджер вакансий.
+    :param vacancy_manager: Модуль src.vacancy_manager.
+    :return: Множество идентификаторов.
+    """
+    if isinstance(storage, vacancy_manager.VacancyManagerColumnar):
+        # Из колоночного файла достаточно прочитать один столбец
+        return {vac['id'] for vac in storage.get_vacancies(columns=['id'])}
+    return {vac['id'] for vac in storage.get_vacancies()}
+
+
+def run_search(args: argparse.Namespace, timer: StartupTimer) -> int:
+    """Ищет вакансии на hh.ru, выводит топ N и при необходимости сохраняет их в файл."""
+    api = timer.import_module("src.api")
+    functions = timer.import_module("src.functions")
+    vacancy_manager = None
+    if args.output:
+        try:
+            vacancy_manager = import_storage(args.output, timer)
+        except ImportError as e:
+            print(e, file=sys.stderr)
+            return EXIT_ERROR
+    if args.startup_time:
+        timer.report(args.startup_budget)
+
+    hh_vacancies_json = api.HeadHunterAPI().get_vacancies(args.keyword)
+    if not hh_vacancies_json:
+        # HeadHunterAPI возвращает пустой словарь, если запрос завершился ошибкой
+        print("Не удалось получить вакансии с сайта hh.ru.", file=sys.stderr)
+        return EXIT_ERROR
+
+    hh_vacancies = hh_vacancies_json.get('items', [])
+    if not hh_vacancies:
+        print("Вакансии по вашему запросу не найдены.")
+        return 0
+
+    filtered_vacancies = functions.filter_vacancies(hh_vacancies, filters_from_args(args))
+    if not filtered_vacancies:
+        return 0
+
+    functions.print_top_vacancies(filtered_vacancies, args.top)
+
+    if vacancy_manager is not None:
+        # Файл создаётся только когда есть что сохранить
+        storage = open_storage(args.output, vacancy_manager)
+        if args.overwrite:
+            storage.clear_vacancies()
+            new_vacancies = filtered_vacancies
+        else:
+            # Повторный запуск с тем же файлом не должен дублировать уже сохранённые вакансии
+            saved_ids = saved_vacancy_ids(storage, vacancy_manager)
+            new_vacancies = [vac for vac in filtered_vacancies if vac.id not in saved_ids]
+        storage.add_vacancies(new_vacancies)
+        print(f"Файл '{storage.file_path}' сохранен. Сохранено новых вакансий: {len(new_vacancies)}, "
+              f"пропущено уже сохранённых: {len(filtered_vacancies) - len(new_vacancies)}.")
+    return 0
+
+
+def run_show(args: argparse.Namespace, timer: StartupTimer) -> int:
+    """Выводит топ N вакансий из сохранённого файла, отфильтрованных по аргументам."""
+    if not os.path.exists(args.path):
+        print(f"Файл '{args.path}' не найден.", file=sys.stderr)
+        return EXIT_ERROR
+
+    functions = timer.import_module("src.functions")
+    try:
+        vacancy_manager = import_storage(args.path, timer)
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return EXIT_ERROR
+    storage = open_storage(args.path, vacancy_manager)
+    if args.startup_time:
+        timer.report(args.startup_budget)
+
+    filters = filters_from_args(args)
+    if isinstance(storage, vacancy_manager.VacancyManagerColumnar):
+        # Колоночное хранилище само применяет фильтры get_filters и пропускает лишние группы строк
+        saved_vacancies = storage.get_vacancies(filters)
+    else:
+        saved_vacancies = functions.filter_vacancies_from_file(storage.get_vacancies(), filters)
+
+    if not saved_vacancies:
+        print("По выбранным критериям вакансии не найдены.")
+        return 0
+
+    top_vacancies: List[Dict[str, Any]] = sorted(
+        saved_vacancies, key=lambda v: (v.get('salary_from') or 0, v.get('salary_to') or 0), reverse=True
+    )[:args.top]
+    functions.print_filtered_vacancies(top_vacancies)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None, start_time: Optional[float] = None) -> int:
+    """
+    Точка входа неинтерактивного режима.
+
+    :param argv: Аргументы командной строки. По умолчанию - sys.argv[1:].
+    :param start_time: Момент запуска программы по time.perf_counter.
+    :return: Код завершения.
+    """
+    timer = StartupTimer(start_time)
+    args = build_parser().parse_args(argv)
+    if args.startup_budget is not None:
+        args.startup_time = True
+
+    if args.command == "search":
+        exit_code = run_search(args, timer)
+    else:
+        exit_code = run_show(args, timer)
+
+    if exit_code == 0 and timer.over_budget:
+        return EXIT_OVER_BUDGET
+    return exit_code
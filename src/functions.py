@@ -1,6 +1,6 @@
 from datetime import datetime, date
 import re
-from .vacancy import Vacancy
+from .vacancy import FILTER_FIELDS, Vacancy
 
 
 def get_filters():
@@ -193,7 +193,7 @@ def filter_vacancies_from_file(vacancies, filters):
             # Преобразование значений для сравнения
             if filter_key in ['зарплата от', 'зарплата до']:
                 filter_val = int(filter_val)
-                vac_val = int(vac.get(filter_key.replace(" ", "_"), 0))
+                vac_val = int(vac.get(FILTER_FIELDS[filter_key]) or 0)
 
             elif filter_key == 'дата публикации':
                 vac_date = datetime.strptime(vac['published_at'], "%Y-%m-%dT%H:%M:%S%z").date()
@@ -203,7 +203,7 @@ def filter_vacancies_from_file(vacancies, filters):
                     match = False
 
             elif filter_key == 'город' or filter_key == 'опыт работы':
-                vac_val = vac.get(filter_key.replace(" ", "_"), "").lower()
+                vac_val = (vac.get(FILTER_FIELDS[filter_key]) or "").lower()
                 filter_val = filter_val.lower()
 
             # Сравнение значений
@@ -1,6 +1,15 @@
 from datetime import datetime
 from typing import Dict, Optional
 
+# Соответствие фильтров get_filters ключам вакансии в Vacancy.to_dict
+FILTER_FIELDS = {
+    'зарплата от': 'salary_from',
+    'зарплата до': 'salary_to',
+    'город': 'city',
+    'дата публикации': 'published_at',
+    'опыт работы': 'experience',
+}
+
 
 class Vacancy:
     """
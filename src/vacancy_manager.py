@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+import csv
+from datetime import datetime, date
 import json
 from pathlib import Path
 from typing import List, Dict, Any
-from src.vacancy import Vacancy
+from src.vacancy import FILTER_FIELDS, Vacancy
 
 
 class VacancyManagerAbstract(ABC):
@@ -60,6 +62,21 @@ class VacancyManagerJSON(VacancyManagerAbstract):
         vacancies.append(vacancy.to_dict())  # Преобразование вакансии в словарь
         self._save_vacancies(vacancies)
 
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        """
+        Добавляет несколько вакансий в JSON-файл за одну перезапись.
+
+        Args:
+            vacancies (List[Vacancy]): Объекты вакансий или словари в формате Vacancy.to_dict.
+        """
+        saved_vacancies = self._load_vacancies()
+        saved_vacancies.extend(vac.to_dict() if isinstance(vac, Vacancy) else vac for vac in vacancies)
+        self._save_vacancies(saved_vacancies)
+
+    def clear_vacancies(self) -> None:
+        """Удаляет все вакансии из файла."""
+        self._save_vacancies([])
+
     def get_vacancies(self, filters: dict = None) -> List[Dict]:
         """
         Возвращает отфильтрованный список вакансий в виде словарей, соответствующих заданным фильтрам.
@@ -173,3 +190,335 @@ class VacancyManagerJSON(VacancyManagerAbstract):
 
         except IndexError:
             return "Одна из указанных вакансий не существует в сохранённом файле."
+
+
+def _import_pyarrow():
+    """
+    Лениво импортирует pyarrow, чтобы он не замедлял запуск программы.
+
+    Returns:
+        tuple | None: Модули (pyarrow, pyarrow.parquet) или None, если pyarrow не установлен.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow, pyarrow.parquet
+
+
+class VacancyManagerColumnar(VacancyManagerJSON):
+    """
+    Класс для управления вакансиями с хранением данных в колоночном формате.
+
+    Основной формат - Parquet (требуется pyarrow): вакансии хранятся в каталоге с указанным
+    именем, и каждое добавление записывает в него новую часть part-NNNNN.parquet. Если путь
+    оканчивается на .csv или формат не указан и pyarrow не установлен, используется CSV,
+    который читается построчно, без загрузки всего файла в память; незаполненные строковые
+    поля в CSV читаются как ''. Фильтры из get_filters для Parquet проверяются по статистике
+    групп строк (row groups), поэтому группы, в которых заведомо нет подходящих вакансий,
+    не читаются с диска.
+    """
+
+    COLUMNS = ['id', 'name', 'url', 'salary_from', 'salary_to', 'description', 'employer',
+               'city', 'published_at', 'experience', 'employment_type', 'schedule']
+    INT_COLUMNS = ('salary_from', 'salary_to')
+
+    # Служебные столбцы Parquet со значениями в нижнем регистре для фильтров без учёта регистра
+    LOWER_COLUMNS = {
+        'city': 'city_lower',
+        'experience': 'experience_lower',
+    }
+
+    def __init__(self, file_path: str, row_group_size: int = 10000):
+        """
+        Инициализирует менеджер вакансий с указанием пути к файлу Parquet или CSV.
+
+        Args:
+            file_path (str): Путь к файлу. Формат определяется расширением .parquet или .csv. Для пути
+                без этих расширений используется Parquet, а если pyarrow не установлен - CSV
+                с расширением .csv.
+            row_group_size (int, optional): Количество строк в одной группе Parquet. Defaults to 10000.
+
+        Raises:
+            ValueError: Если у файла другое расширение.
+            ImportError: Если указан файл .parquet, а pyarrow не установлен.
+        """
+        self.file_path = Path(file_path)
+        if self.file_path.suffix not in ('', '.parquet', '.csv'):
+            raise ValueError(f"Неподдерживаемый формат файла '{self.file_path}': используйте .parquet или .csv")
+        self.row_group_size = row_group_size
+        self._arrow = None if self.file_path.suffix == '.csv' else _import_pyarrow()
+        if self._arrow is None and self.file_path.suffix == '.parquet':
+            raise ImportError(f"Для работы с файлом '{self.file_path}' требуется pyarrow: poetry install -E parquet")
+        if self._arrow is None:
+            self.file_path = self.file_path.with_suffix('.csv')
+        if self.is_parquet:
+            # Parquet хранится каталогом из частей, чтобы добавление не перезаписывало старые данные
+            self.file_path.mkdir(parents=True, exist_ok=True)
+        else:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)  # Создание директории, если не существует
+            if not self.file_path.exists():
+                self._save_vacancies([])  # Создание пустого файла, если не существует
+
+    @property
+    def is_parquet(self) -> bool:
+        """Возвращает True, если вакансии хранятся в формате Parquet."""
+        return self._arrow is not None
+
+    def _load_vacancies(self, filters: Dict[str, Any] = None, columns: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Загружает вакансии из файла, читая только нужные столбцы и подходящие группы строк.
+
+        Args:
+            filters (Dict[str, Any], optional): Фильтры в формате get_filters. Defaults to None.
+            columns (List[str], optional): Столбцы для чтения. Defaults to None (все столбцы).
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий в виде словарей.
+        """
+        columns = list(columns or self.COLUMNS)
+        read_columns = list(columns)
+        for filter_key in filters or {}:
+            filter_column = FILTER_FIELDS.get(filter_key)
+            if filter_column and filter_column not in read_columns:
+                read_columns.append(filter_column)
+
+        if self.is_parquet:
+            rows = self._read_parquet(read_columns, filters)
+        else:
+            rows = self._read_csv(read_columns)
+
+        if filters:
+            rows = (row for row in rows if self._matches_filters(row, filters))
+        if read_columns != columns:
+            rows = ({column: row[column] for column in columns} for row in rows)
+        return list(rows)
+
+    def _parquet_parts(self) -> List[Path]:
+        """Возвращает файлы частей Parquet в порядке их записи."""
+        return sorted(self.file_path.glob('part-*.parquet'), key=lambda part: int(part.stem.split('-')[1]))
+
+    def _read_parquet(self, columns: List[str], filters: Dict[str, Any] = None):
+        """Читает из частей Parquet группы строк, статистика которых не исключает совпадение с фильтрами."""
+        _, pq = self._arrow
+        rows = []
+        for part in self._parquet_parts():
+            parquet_file = pq.ParquetFile(part)
+            metadata = parquet_file.metadata
+            column_indexes = {metadata.schema.column(i).name: i for i in range(metadata.num_columns)}
+
+            row_groups = [
+                index for index in range(metadata.num_row_groups)
+                if not filters or self._row_group_may_match(metadata.row_group(index), column_indexes, filters)
+            ]
+            if row_groups:
+                rows.extend(parquet_file.read_row_groups(row_groups, columns=columns).to_pylist())
+        return rows
+
+    def _read_csv(self, columns: List[str]):
+        """
+        Построчно читает CSV-файл, приводя значения к типам, которые хранит Vacancy.
+
+        CSV не различает None и пустую строку: пустая зарплата читается как None, а пустые
+        строковые поля (в том числе сохранённые как None) - как ''.
+        """
+        with self.file_path.open('r', encoding='utf-8', newline='') as file:
+            for record in csv.DictReader(file):
+                row = {}
+                for column in columns:
+                    value = record.get(column)
+                    if column in self.INT_COLUMNS:
+                        # Пустая ячейка в числовом столбце означает незаполненную зарплату
+                        value = int(value) if value else None
+                    row[column] = value
+                yield row
+
+    def _row_group_may_match(self, row_group, column_indexes: Dict[str, int], filters: Dict[str, Any]) -> bool:
+        """
+        Проверяет по статистике min/max, может ли группа строк содержать подходящие вакансии.
+
+        Проверка консервативна: False возвращается только тогда, когда ни одна строка группы
+        заведомо не пройдёт _matches_filters.
+
+        Args:
+            row_group: Метаданные группы строк Parquet.
+            column_indexes (Dict[str, int]): Соответствие имён столбцов их индексам в схеме.
+            filters (Dict[str, Any]): Фильтры в формате get_filters.
+
+        Returns:
+            bool: False, если группу строк можно пропустить.
+        """
+        for filter_key, filter_val in filters.items():
+            column = FILTER_FIELDS.get(filter_key)
+            # Для строк без учёта регистра статистика берётся из столбца со значениями в нижнем регистре
+            column = self.LOWER_COLUMNS.get(column, column)
+            if column not in column_indexes:
+                continue
+            chunk = row_group.column(column_indexes[column])
+            stats = chunk.statistics
+            if stats is None:
+                continue
+            all_null = stats.null_count == row_group.num_rows
+
+            if filter_key in ('зарплата от', 'зарплата до'):
+                # Пустая зарплата считается нулевой, поэтому при фильтре <= 0 подходит любая строка
+                filter_val = int(filter_val)
+                if filter_val > 0 and (all_null or (stats.has_min_max and stats.max < filter_val)):
+                    return False
+
+            elif filter_key == 'дата публикации':
+                if all_null or not stats.has_min_max:
+                    continue
+                start_date = datetime.strptime(filter_val, "%d.%m.%Y").date().isoformat()
+                # Дата в ISO-строке идёт первой, поэтому строковые min/max ограничивают и даты
+                if stats.max[:10] < start_date or stats.min[:10] > date.today().isoformat():
+                    return False
+
+            elif filter_key in ('город', 'опыт работы'):
+                if not stats.has_min_max:
+                    continue
+                if not (stats.min <= filter_val.lower() <= stats.max):
+                    return False
+        return True
+
+    def _matches_filters(self, vacancy: Dict, filters: Dict[str, Any]) -> bool:
+        """
+        Проверяет, соответствует ли вакансия фильтрам get_filters.
+
+        Зарплата должна быть не меньше значения фильтра (пустая зарплата считается нулевой),
+        город и опыт работы сравниваются без учёта регистра, а дата публикации должна лежать
+        между датой фильтра и сегодняшним днём.
+
+        Args:
+            vacancy (Dict): Словарь с данными вакансии для проверки.
+            filters (Dict[str, Any]): Словарь с критериями фильтрации.
+
+        Returns:
+            bool: Возвращает True, если вакансия соответствует всем фильтрам.
+        """
+        for filter_key, filter_val in filters.items():
+            column = FILTER_FIELDS.get(filter_key, filter_key)
+            vac_val = vacancy.get(column)
+
+            if filter_key in ('зарплата от', 'зарплата до'):
+                if (vac_val or 0) < int(filter_val):
+                    return False
+            elif filter_key == 'дата публикации':
+                vac_date = datetime.strptime(vac_val, "%Y-%m-%dT%H:%M:%S%z").date()
+                start_date = datetime.strptime(filter_val, "%d.%m.%Y").date()
+                if not (start_date <= vac_date <= date.today()):
+                    return False
+            elif filter_key in ('город', 'опыт работы'):
+                if (vac_val or '').lower() != filter_val.lower():
+                    return False
+            elif vac_val != filter_val:
+                return False
+        return True
+
+    def _write_parquet_part(self, vacancies: List[Dict[str, Any]]) -> None:
+        """Записывает вакансии в новую часть Parquet после уже существующих."""
+        pa, pq = self._arrow
+        schema = pa.schema(
+            [(column, pa.int64() if column in self.INT_COLUMNS else pa.string()) for column in self.COLUMNS]
+            + [(column, pa.string()) for column in self.LOWER_COLUMNS.values()]
+        )
+        rows = []
+        for vac in vacancies:
+            row = self._to_row(vac)
+            for column, lower_column in self.LOWER_COLUMNS.items():
+                row[lower_column] = (row[column] or '').lower()
+            rows.append(row)
+        table = pa.Table.from_pylist(rows, schema=schema)
+
+        parts = self._parquet_parts()
+        index = int(parts[-1].stem.split('-')[1]) + 1 if parts else 0
+        pq.write_table(table, self.file_path / f'part-{index:05d}.parquet',
+                       row_group_size=self.row_group_size, write_statistics=True)
+
+    def _save_vacancies(self, vacancies: List[Dict[str, Any]]) -> None:
+        """Перезаписывает файл списком вакансий."""
+        if self.is_parquet:
+            # Новая часть пишется до удаления старых, чтобы при ошибке записи данные не потерялись
+            old_parts = self._parquet_parts()
+            if vacancies:
+                self._write_parquet_part(vacancies)
+            for part in old_parts:
+                part.unlink()
+        else:
+            with self.file_path.open('w', encoding='utf-8', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=self.COLUMNS)
+                writer.writeheader()
+                writer.writerows(self._to_row(vac) for vac in vacancies)
+
+    def _to_row(self, vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """Оставляет в словаре вакансии только столбцы файла."""
+        return {column: vacancy.get(column) for column in self.COLUMNS}
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет новую вакансию в файл.
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для добавления.
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> None:
+        """
+        Добавляет несколько вакансий за одну запись в файл.
+
+        CSV дописывается в конец, для Parquet записывается новая часть, а старые не читаются
+        и не перезаписываются.
+
+        Args:
+            vacancies (List[Vacancy]): Объекты вакансий или словари в формате Vacancy.to_dict.
+        """
+        new_rows = [vac.to_dict() if isinstance(vac, Vacancy) else vac for vac in vacancies]
+        if self.is_parquet:
+            if new_rows:
+                self._write_parquet_part(new_rows)
+        else:
+            with self.file_path.open('a', encoding='utf-8', newline='') as file:
+                csv.DictWriter(file, fieldnames=self.COLUMNS).writerows(self._to_row(vac) for vac in new_rows)
+
+    def get_vacancies(self, filters: dict = None, columns: List[str] = None) -> List[Dict]:
+        """
+        Возвращает список вакансий в виде словарей, соответствующих фильтрам get_filters.
+
+        Args:
+            filters (dict, optional): Словарь с критериями фильтрации. Defaults to None.
+            columns (List[str], optional): Столбцы, которые нужно вернуть. Defaults to None (все столбцы).
+
+        Returns:
+            List[Dict]: Список отфильтрованных вакансий в виде словарей.
+        """
+        return self._load_vacancies(filters, columns)
+
+    def import_json(self, json_path: str) -> int:
+        """
+        Импортирует вакансии из JSON-файла, сохранённого VacancyManagerJSON.
+
+        Args:
+            json_path (str): Путь к JSON-файлу.
+
+        Returns:
+            int: Количество импортированных вакансий.
+        """
+        vacancies = VacancyManagerJSON(json_path).get_vacancies()
+        self.add_vacancies(vacancies)
+        return len(vacancies)
+
+    def export_json(self, json_path: str) -> int:
+        """
+        Экспортирует вакансии в JSON-файл в формате VacancyManagerJSON.
+
+        Args:
+            json_path (str): Путь к JSON-файлу.
+
+        Returns:
+            int: Количество экспортированных вакансий.
+        """
+        vacancies = self.get_vacancies()
+        VacancyManagerJSON(json_path)._save_vacancies(vacancies)
+        return len(vacancies)
@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+from argparse import Namespace
+
+import pytest
+
+from src import cli
+from src.vacancy import Vacancy
+from src.vacancy_manager import VacancyManagerColumnar, VacancyManagerJSON
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HH_ITEMS = [
+    {
+        'id': str(i),
+        'name': f'Python-разработчик {i}',
+        'alternate_url': f'https://hh.ru/vacancy/{i}',
+        'salary': {'from': 100000 + i * 1000, 'to': None, 'currency': 'RUR'},
+        'snippet': {'requirement': 'Python', 'responsibility': None},
+        'employer': {'name': 'Компания'},
+        'area': {'name': 'Москва'},
+        'published_at': '2024-03-01T10:00:00+0300',
+        'experience': {'name': 'Нет опыта'},
+        'employment': {'name': 'Полная занятость'},
+        'schedule': {'name': 'Полный день'},
+    }
+    for i in range(5)
+]
+
+
+@pytest.fixture
+def saved_json(tmp_path):
+    path = tmp_path / 'saved.json'
+    VacancyManagerJSON(str(path)).add_vacancies([Vacancy(item) for item in HH_ITEMS])
+    return str(path)
+
+
+@pytest.fixture
+def hh_response(monkeypatch):
+    """Подменяет ответ hh.ru, возвращая функцию для установки ответа."""
+    pytest.importorskip('requests')
+    from src.api import HeadHunterAPI
+
+    def set_response(response):
+        monkeypatch.setattr(HeadHunterAPI, 'get_vacancies', lambda self, search_query, page=0: response)
+
+    return set_response
+
+
+@pytest.mark.parametrize('args', [['--help'], ['show', '{saved_json}']])
+def test_cli_does_not_import_requests(args, saved_json):
+    argv = ['main.py'] + [arg.format(saved_json=saved_json) for arg in args]
+    code = (
+        "import runpy, sys\n"
+        f"sys.argv = {argv!r}\n"
+        "try:\n"
+        "    runpy.run_path('main.py', run_name='__main__')\n"
+        "except SystemExit as e:\n"
+        "    assert not e.code, e.code\n"
+        "print('requests' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == 'False'
+
+
+def test_filters_from_args():
+    args = Namespace(salary_from=100000, salary_to=None, city='Москва', date='01.03.2024', experience=None)
+    assert cli.filters_from_args(args) == {
+        'зарплата от': '100000',
+        'город': 'Москва',
+        'дата публикации': '01.03.2024',
+    }
+
+
+def test_search_api_error_returns_error(hh_response, tmp_path):
+    hh_response({})
+    assert cli.main(['search', 'python', '-o', str(tmp_path / 'out' / 'x.csv')]) == cli.EXIT_ERROR
+    assert not (tmp_path / 'out').exists()
+
+
+def test_search_without_results_returns_ok(hh_response, tmp_path):
+    hh_response({'items': []})
+    assert cli.main(['search', 'python', '-o', str(tmp_path / 'out' / 'x.csv')]) == 0
+    assert not (tmp_path / 'out').exists()
+
+
+def test_search_saves_without_duplicates(hh_response, tmp_path):
+    hh_response({'items': HH_ITEMS})
+    output = str(tmp_path / 'out' / 'x.csv')
+
+    assert cli.main(['search', 'python', '--top', '1', '-o', output]) == 0
+    assert cli.main(['search', 'python', '--top', '1', '-o', output]) == 0
+
+    saved_ids = [vac['id'] for vac in VacancyManagerColumnar(output).get_vacancies()]
+    assert saved_ids == [item['id'] for item in HH_ITEMS]
+
+
+def test_search_overwrite_replaces_file(hh_response, tmp_path):
+    output = str(tmp_path / 'x.json')
+    hh_response({'items': HH_ITEMS})
+    assert cli.main(['search', 'python', '--top', '0', '-o', output]) == 0
+    hh_response({'items': HH_ITEMS[:2]})
+    assert cli.main(['search', 'python', '--top', '0', '-o', output, '--overwrite']) == 0
+
+    assert [vac['id'] for vac in VacancyManagerJSON(output).get_vacancies()] == ['0', '1']
+
+
+def test_show_filters_saved_file(saved_json, capsys):
+    assert cli.main(['show', saved_json, '--salary-from', '103000']) == 0
+    output = capsys.readouterr().out
+    assert 'Python-разработчик 3' in output and 'Python-разработчик 4' in output
+    assert 'Python-разработчик 2' not in output
+
+
+def test_show_missing_file_returns_error(tmp_path):
+    missing = tmp_path / 'missing.json'
+    assert cli.main(['show', str(missing)]) == cli.EXIT_ERROR
+    assert not missing.exists()
+
+
+def test_invalid_arguments_exit_with_usage_error():
+    with pytest.raises(SystemExit) as error:
+        cli.main(['show', 'saved.json', '--date', '2024-03-01'])
+    assert error.value.code == 2
+
+
+def test_startup_budget_exceeded_returns_over_budget(saved_json):
+    assert cli.main(['--startup-budget', '0.000001', 'show', saved_json]) == cli.EXIT_OVER_BUDGET
+
+
+def test_startup_budget_met_returns_ok(saved_json):
+    assert cli.main(['--startup-budget', '60000', 'show', saved_json]) == 0
@@ -0,0 +1,124 @@
+import pytest
+
+from src import vacancy_manager
+from src.vacancy import Vacancy
+from src.vacancy_manager import VacancyManagerColumnar
+
+CITIES = ['Москва', 'Казань', 'Санкт-Петербург']
+
+
+def make_vacancies(count):
+    """Создаёт вакансии, упорядоченные по городу, чтобы группы строк различались статистикой."""
+    vacancies = []
+    for i in range(count):
+        vacancies.append(Vacancy({
+            'id': str(i),
+            'name': f'Вакансия {i}',
+            'alternate_url': f'https://hh.ru/vacancy/{i}',
+            'salary': {'from': i * 1000 if i % 4 else None, 'to': i * 2000 if i % 3 else None, 'currency': 'RUR'},
+            'snippet': {'requirement': None, 'responsibility': None} if i % 2 else {'requirement': 'Python'},
+            'employer': {'name': f'Компания {i % 5}' if i % 7 else None},
+            'area': {'name': CITIES[i * len(CITIES) // count]},
+            'published_at': f'2024-03-{i % 28 + 1:02d}T10:00:00+0300',
+            'experience': {'name': 'Нет опыта' if i % 2 else 'От 1 года до 3 лет'},
+            'employment': {'name': 'Полная занятость'},
+            'schedule': {'name': 'Полный день'},
+        }))
+    return vacancies
+
+
+@pytest.fixture
+def parquet_manager(tmp_path):
+    pytest.importorskip('pyarrow')
+    manager = VacancyManagerColumnar(str(tmp_path / 'vacancies.parquet'), row_group_size=10)
+    manager.add_vacancies(make_vacancies(90))
+    return manager
+
+
+@pytest.mark.parametrize('filters', [
+    {'город': 'казань'},
+    {'город': 'МОСКВА', 'зарплата от': '20000'},
+    {'зарплата от': '60000'},
+    {'зарплата до': '150000'},
+    {'дата публикации': '20.03.2024'},
+    {'опыт работы': 'нет опыта', 'город': 'Санкт-Петербург'},
+    {'город': 'Новосибирск'},
+])
+def test_parquet_pushdown_matches_full_scan(parquet_manager, filters):
+    expected = [vac for vac in parquet_manager.get_vacancies() if parquet_manager._matches_filters(vac, filters)]
+    assert parquet_manager.get_vacancies(filters) == expected
+
+
+def test_parquet_pushdown_skips_row_groups_by_city(parquet_manager, monkeypatch):
+    read_row_groups = []
+    original = parquet_manager._row_group_may_match
+
+    def spy(row_group, column_indexes, filters):
+        result = original(row_group, column_indexes, filters)
+        read_row_groups.append(result)
+        return result
+
+    monkeypatch.setattr(parquet_manager, '_row_group_may_match', spy)
+    vacancies = parquet_manager.get_vacancies({'город': 'казань'})
+
+    assert {vac['city'] for vac in vacancies} == {'Казань'}
+    assert read_row_groups.count(True) == 3
+    assert read_row_groups.count(False) == 6
+
+
+def test_parquet_columns_projection(parquet_manager):
+    vacancies = parquet_manager.get_vacancies({'город': 'Москва'}, columns=['id', 'salary_from'])
+    assert vacancies and all(set(vac) == {'id', 'salary_from'} for vac in vacancies)
+
+
+def test_csv_round_trip_matches_json(tmp_path):
+    vacancies = [vac.to_dict() for vac in make_vacancies(30)]
+    manager = VacancyManagerColumnar(str(tmp_path / 'vacancies.csv'))
+    manager.add_vacancies(vacancies)
+
+    # CSV хранит пустые строковые поля как '', а пустую зарплату - как None
+    expected = [
+        {key: '' if value is None and key not in manager.INT_COLUMNS else value for key, value in vac.items()}
+        for vac in vacancies
+    ]
+    assert any(vac['employer'] is None for vac in vacancies)
+    assert any(vac['salary_from'] is None for vac in vacancies)
+    assert manager.get_vacancies() == expected
+
+
+def test_parquet_round_trip_keeps_none(parquet_manager):
+    vacancies = [vac.to_dict() for vac in make_vacancies(90)]
+    assert parquet_manager.get_vacancies() == vacancies
+
+
+def test_explicit_parquet_without_pyarrow_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(vacancy_manager, '_import_pyarrow', lambda: None)
+    with pytest.raises(ImportError):
+        VacancyManagerColumnar(str(tmp_path / 'vacancies.parquet'))
+    assert not (tmp_path / 'vacancies.csv').exists()
+
+
+def test_unsupported_suffix_raises(tmp_path):
+    with pytest.raises(ValueError):
+        VacancyManagerColumnar(str(tmp_path / 'vacancies.json'))
+    assert not (tmp_path / 'vacancies.json').exists()
+
+
+def test_parquet_append_writes_new_part(parquet_manager):
+    first_part = parquet_manager._parquet_parts()[0]
+    first_part_mtime = first_part.stat().st_mtime_ns
+    extra = [vac.to_dict() for vac in make_vacancies(5)]
+
+    parquet_manager.add_vacancies(extra)
+
+    assert len(parquet_manager._parquet_parts()) == 2
+    assert first_part.stat().st_mtime_ns == first_part_mtime
+    assert parquet_manager.get_vacancies()[-5:] == extra
+
+
+def test_parquet_delete_compacts_parts(parquet_manager):
+    parquet_manager.add_vacancies(make_vacancies(5))
+    parquet_manager.delete_vacancies_by_indexes([1, 2])
+
+    assert len(parquet_manager._parquet_parts()) == 1
+    assert len(parquet_manager.get_vacancies()) == 93